@@ -109,6 +109,10 @@ class Drawer:
         right = round(left + size[0])
         bottom = round(top + size[1])
 
+        if image.size == (new_width, new_height) == size:
+            # Already the target size, nothing to resample or crop
+            return image.copy()
+
         image = image.resize((new_width, new_height), resample=Image.Resampling.LANCZOS)
         return image.crop((left, top, right, bottom))
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFont
 
 from hoyo_buddy.draw.drawer import TRANSPARENT, WHITE, Drawer
 from hoyo_buddy.draw.mixins import HSRChallengeUIDMixin
@@ -20,6 +21,45 @@ if TYPE_CHECKING:
     )
 
     from hoyo_buddy.enums import Locale
+    from hoyo_buddy.types import FontStyle
+
+ASSET_FOLDER = "hoyo-buddy-assets/assets/apc-shadow"
+BLOCK_SIZE = 120
+BLOCK_GAP = 52
+BLOCKS_PER_ROW = 4
+STAGE_POSITIONS = ((83, 482), (862, 482), (83, 980), (862, 980))
+
+BLOCK_TEXT_COLOR = Drawer.apply_color_opacity(WHITE, 1.0)
+
+
+@functools.cache
+def _open_asset(filename: str) -> Image.Image:
+    """Open an APC shadow asset once per process and reuse the decoded image.
+
+    The returned image is shared, callers must copy it before drawing on it.
+    """
+    image = Drawer.open_image(f"{ASSET_FOLDER}/{filename}")
+    image.load()
+    return image
+
+
+@functools.cache
+def _draw_empty_block() -> Image.Image:
+    """Draw the placeholder block used for empty character slots.
+
+    The returned image is shared, callers must copy it before drawing on it.
+    """
+    block = _open_asset("block.png").copy()
+    empty = _open_asset("empty.png")
+    block.alpha_composite(empty, (28, 28))
+    return block
+
+
+@functools.cache
+def _get_font(style: FontStyle, size: int) -> ImageFont.FreeTypeFont:
+    """Get a font for the default locale, opened once per process."""
+    drawer = Drawer(ImageDraw.Draw(Image.new("RGBA", (1, 1))), folder="apc-shadow", dark_mode=True)
+    return drawer.get_font(size, style)
 
 
 class APCShadowCard(HSRChallengeUIDMixin):
@@ -69,48 +109,49 @@ class APCShadowCard(HSRChallengeUIDMixin):
         )
 
     def _draw_block(self, chara: FloorCharacter | None = None) -> Image.Image:
-        block = Drawer.open_image("hoyo-buddy-assets/assets/apc-shadow/block.png")
         if chara is None:
-            empty = Drawer.open_image("hoyo-buddy-assets/assets/apc-shadow/empty.png")
-            block.paste(empty, (28, 28), empty)
-            return block
+            return _draw_empty_block()
+
+        block = _open_asset("block.png").copy()
 
         drawer = Drawer(ImageDraw.Draw(block), folder="apc-shadow", dark_mode=True)
 
         icon = drawer.open_static(chara.icon)
         icon = drawer.resize_crop(icon, (120, 120))
-        mask = drawer.open_asset("mask.png")
+        mask = _open_asset("mask.png")
         icon = drawer.mask_image_with_image(icon, mask)
-        block.paste(icon, (0, 0), icon)
+        block.alpha_composite(icon)
+
+        # Level and rank are plain numbers, so draw them directly with a cached font instead of
+        # going through Drawer.write's translation and glyph fallback checks
+        font = _get_font("bold", 18)
 
-        level_flair = drawer.open_asset("level_flair.png")
+        level_flair = _open_asset("level_flair.png")
         level_flair_pos = (0, 97)
-        block.paste(level_flair, level_flair_pos, level_flair)
-        drawer.write(
-            f"Lv.{chara.level}",
-            size=18,
-            position=(
+        block.alpha_composite(level_flair, level_flair_pos)
+        drawer.draw.text(
+            (
                 level_flair_pos[0] + level_flair.width // 2,
                 level_flair_pos[1] + level_flair.height // 2,
             ),
-            style="bold",
+            f"Lv.{chara.level}",
+            font=font,
+            fill=BLOCK_TEXT_COLOR,
             anchor="mm",
-            color=WHITE,
         )
 
-        const_flair = drawer.open_asset("const_flair.png")
+        const_flair = _open_asset("const_flair.png")
         const_flair_pos = (91, 0)
-        block.paste(const_flair, const_flair_pos, const_flair)
-        drawer.write(
-            str(chara.rank),
-            size=18,
-            position=(
+        block.alpha_composite(const_flair, const_flair_pos)
+        drawer.draw.text(
+            (
                 const_flair_pos[0] + const_flair.width // 2,
                 const_flair_pos[1] + const_flair.height // 2,
             ),
-            style="bold",
+            str(chara.rank),
+            font=font,
+            fill=BLOCK_TEXT_COLOR,
             anchor="mm",
-            color=WHITE,
         )
 
         return block
@@ -138,59 +179,61 @@ class APCShadowCard(HSRChallengeUIDMixin):
         )
 
         rightmost = max(name_tbox[2], score_tbox[2])
-        line = drawer.open_asset("line.png")
+        line = _open_asset("line.png")
         padding = 26
         im.paste(line, (rightmost + padding, 10))
 
-        star = drawer.open_asset("star.png")
+        star = _open_asset("star.png")
         pos = (rightmost + padding + 37, 0)
         for _ in range(stage.star_num):
             im.paste(star, pos)
             pos = (pos[0] + 62, pos[1])
 
-        defeated_text = LocaleStr(key="apc_shadow.boss_defeated").translate(self._locale)
-        not_defeated_text = LocaleStr(key="apc_shadow.boss_defeated_no").translate(self._locale)
-        quick_clear_text = LocaleStr(key="moc_quick_clear").translate(self._locale)
-
         if stage.is_quick_clear:
-            text = quick_clear_text
+            text = self._quick_clear_text
         elif stage.node_1.boss_defeated and stage.node_2.boss_defeated:
-            text = defeated_text
+            text = self._defeated_text
         elif not stage.node_1.boss_defeated and not stage.node_2.boss_defeated:
-            text = not_defeated_text
+            text = self._not_defeated_text
         else:
-            text = f"{defeated_text} / {not_defeated_text}"
+            text = f"{self._defeated_text} / {self._not_defeated_text}"
 
         drawer.write(
             text, size=25, position=(rightmost + padding + 37, 60), color=WHITE, locale=self._locale
         )
 
         characters = stage.node_1.avatars + stage.node_2.avatars
+        chara_num = len(characters)
 
-        pos = (0, 135)
+        row_width = BLOCKS_PER_ROW * BLOCK_SIZE + (BLOCKS_PER_ROW - 1) * BLOCK_GAP
+        row = Image.new("RGBA", (row_width, BLOCK_SIZE), TRANSPARENT)
         for i in range(8):
-            try:
-                chara = characters[i]
-            except IndexError:
-                chara = None
+            chara = characters[i] if i < chara_num else None
 
+            # Blocks don't overlap, so copy them into the row as-is and composite the whole row
+            # onto the stage once; the second row overwrites every slot of the first
             block = self._draw_block(chara)
-            im.paste(block, pos, block)
-            pos = (pos[0] + 172, pos[1])
+            row.paste(block, ((i % BLOCKS_PER_ROW) * (BLOCK_SIZE + BLOCK_GAP), 0))
 
             if i == 3:
-                pos = (0, 301)
+                im.paste(row, (0, 135), row)
 
+        im.paste(row, (0, 301), row)
         return im
 
     def draw(self) -> BytesIO:
-        stages = [f for f in self._data.floors if not f.is_quick_clear]
-        stages.reverse()
+        stages = [f for f in reversed(self._data.floors) if not f.is_quick_clear]
 
         filename = "apc_shadow_short.png" if len(stages) <= 2 else "apc_shadow.png"
-        self._im = Drawer.open_image(f"hoyo-buddy-assets/assets/apc-shadow/{filename}")
+        self._im = Drawer.open_image(f"{ASSET_FOLDER}/{filename}")
         self._drawer = Drawer(ImageDraw.Draw(self._im), folder="apc-shadow", dark_mode=True)
 
+        self._defeated_text = LocaleStr(key="apc_shadow.boss_defeated").translate(self._locale)
+        self._not_defeated_text = LocaleStr(key="apc_shadow.boss_defeated_no").translate(
+            self._locale
+        )
+        self._quick_clear_text = LocaleStr(key="moc_quick_clear").translate(self._locale)
+
         self._write_title()
         self._write_season_time()
         self._write_max_stars()
@@ -198,13 +241,8 @@ class APCShadowCard(HSRChallengeUIDMixin):
         self._write_times_challenged()
         self._write_uid()
 
-        pos = (83, 482)
-        for i, stage in enumerate(stages):
+        for pos, stage in zip(STAGE_POSITIONS, stages, strict=False):
             stage_im = self._draw_stage(stage)
             self._im.paste(stage_im, pos, stage_im)
-            pos = (pos[0] + 779, pos[1])
-
-            if i == 1:
-                pos = (83, 980)
 
         return Drawer.save_image(self._im)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
+from io import BytesIO
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import ambr
+import cachetools
 import enka
 import hakushin
+import orjson
 import yatta
 from discord import File
 from genshin.models import ZZZFullAgent
@@ -30,7 +34,6 @@ from .static import ZZZ_V2_GAME_RECORD, download_images
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
-    from io import BytesIO
 
     import genshin
     from genshin.models import (
@@ -46,9 +49,15 @@ if TYPE_CHECKING:
         ZZZNotes,
     )
 
+    from hoyo_buddy.enums import Locale
     from hoyo_buddy.models import DrawInput, FarmData, ItemWithDescription, ItemWithTrailing, Reward
     from hoyo_buddy.types import HardChallengeMode
 
+# Encoded APC shadow cards keyed by a hash of their inputs, capped at 64 MiB of image data
+APC_SHADOW_CARD_CACHE: cachetools.TTLCache[bytes, bytes] = cachetools.TTLCache(
+    maxsize=64 * 1024 * 1024, ttl=3600, getsizeof=len
+)
+
 
 async def draw_item_list_card(
     draw_input: DrawInput, items: list[ItemWithDescription] | list[ItemWithTrailing]
@@ -357,9 +366,24 @@ async def draw_pure_fiction_card(
     return File(buffer, filename=draw_input.filename)
 
 
+def _get_apc_shadow_cache_key(
+    data: StarRailAPCShadow, season: StarRailChallengeSeason, locale: Locale, uid: int | None
+) -> bytes:
+    payload = orjson.dumps(
+        [data.model_dump(mode="json"), season.model_dump(mode="json"), locale.value, uid],
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
 async def draw_apc_shadow_card(
     draw_input: DrawInput, data: StarRailAPCShadow, season: StarRailChallengeSeason, uid: int | None
 ) -> File:
+    cache_key = _get_apc_shadow_cache_key(data, season, draw_input.locale, uid)
+    cached = APC_SHADOW_CARD_CACHE.get(cache_key)
+    if cached is not None:
+        return File(BytesIO(cached), filename=draw_input.filename)
+
     for floor in data.floors:
         icons = [chara.icon for chara in floor.node_1.avatars + floor.node_2.avatars]
         await download_images(icons, draw_input.session)
@@ -368,6 +392,7 @@ async def draw_apc_shadow_card(
         draw_input.executor,
         funcs.hsr.apc_shadow.APCShadowCard(data, season, draw_input.locale, uid).draw,
     )
+    APC_SHADOW_CARD_CACHE[cache_key] = buffer.getvalue()
     buffer.seek(0)
     return File(buffer, filename=draw_input.filename)
 
@@ -9,7 +9,7 @@ import pathlib
 import re
 import time
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote, urlparse
 
@@ -272,6 +272,7 @@ async def get_pixiv_proxy_img(session: aiohttp.ClientSession, url: str) -> str:
     return proxy_img_urls[0]
 
 
+@lru_cache(maxsize=256)
 def get_floor_difficulty(floor_name: str, season_name: str) -> str:
     """Get the difficulty of a floor in a Star Rail challenge."""
     return floor_name.replace(season_name, "").replace(":", "").replace("•", "").strip()
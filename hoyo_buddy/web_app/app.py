@@ -6,7 +6,6 @@ import urllib.parse
 from typing import TYPE_CHECKING, Any, Literal
 
 import aiohttp
-import asyncpg
 import flet as ft
 import genshin
 import orjson
@@ -31,6 +30,7 @@ from .utils import (
     encrypt_string,
     get_gacha_icon,
     get_gacha_names,
+    get_pool,
     refresh_page_view,
     show_error_banner,
     show_loading_snack_bar,
@@ -269,13 +269,11 @@ class WebApp:
         return encrypted_email, encrypted_password
 
     async def _get_user_temp_data(self, user_id: int) -> dict[str, Any]:
-        conn = await asyncpg.connect(CONFIG.db_url)
-        try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
             mmt_result: str = await conn.fetchval(
                 'SELECT temp_data FROM "user" WHERE id = $1', user_id
             )
-        finally:
-            await conn.close()
         return orjson.loads(mmt_result)
 
     async def _get_or_create_device_id(self, page: ft.Page, user_id: int) -> str:
@@ -494,40 +492,34 @@ class WebApp:
 
     @staticmethod
     async def _get_account_game(account_id: int) -> Game:
-        conn = await asyncpg.connect(CONFIG.db_url)
-        try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
             game = await conn.fetchval('SELECT game FROM "hoyoaccount" WHERE id = $1', account_id)
             return Game(game)
-        finally:
-            await conn.close()
 
     @staticmethod
     async def _get_gacha_log_row_num(params: GachaParams) -> int:
-        conn = await asyncpg.connect(CONFIG.db_url)
-        try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
             return await conn.fetchval(
                 'SELECT COUNT(*) FROM "gachahistory" WHERE account_id = $1 AND banner_type = $2 AND rarity = ANY($3)',
                 params.account_id,
                 params.banner_type,
                 params.rarities,
             )
-        finally:
-            await conn.close()
 
     @staticmethod
     async def _check_account_exists(account_id: int) -> bool:
-        conn = await asyncpg.connect(CONFIG.db_url)
-        try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
             return await conn.fetchval(
                 'SELECT EXISTS(SELECT 1 FROM "hoyoaccount" WHERE id = $1)', account_id
             )
-        finally:
-            await conn.close()
 
     @staticmethod
     async def _get_gacha_logs(params: GachaParams) -> list[GachaHistory]:
-        conn = await asyncpg.connect(CONFIG.db_url)
-        try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
             if params.name_contains:
                 rows = await conn.fetch(
                     'SELECT * FROM "gachahistory" WHERE account_id = $1 AND banner_type = $2 AND rarity = ANY($3) ORDER BY wish_id DESC',
@@ -545,8 +537,6 @@ class WebApp:
                     (params.page - 1) * params.size,
                 )
             return [GachaHistory(**row) for row in rows]
-        finally:
-            await conn.close()
 
     async def _get_gacha_icons(self, gachas: Sequence[GachaHistory]) -> dict[int, str]:
         cached_gacha_icons: dict[str, str] = (
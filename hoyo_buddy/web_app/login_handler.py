@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
-import asyncpg
 import flet as ft
 import genshin
 import orjson
@@ -14,7 +13,13 @@ from hoyo_buddy.hoyo.clients.gpy import ProxyGenshinClient
 from ..constants import GEETEST_SERVERS
 from ..l10n import LocaleStr, translator
 from ..models import GeetestLoginPayload
-from .utils import decrypt_string, encrypt_string, show_error_banner, show_loading_snack_bar
+from .utils import (
+    decrypt_string,
+    encrypt_string,
+    get_pool,
+    show_error_banner,
+    show_loading_snack_bar,
+)
 
 if TYPE_CHECKING:
     from genshin.models import ActionTicket, SessionMMT
@@ -48,15 +53,13 @@ async def handle_session_mmt(
         await page.client_storage.set_async(f"hb.{params.user_id}.mobile", encrypt_string(mobile))
 
     # Save mmt data to db
-    conn = await asyncpg.connect(CONFIG.db_url)
-    try:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
         await conn.execute(
             'UPDATE "user" SET temp_data = $1 WHERE id = $2',
             orjson.dumps(result.model_dump()).decode(),
             params.user_id,
         )
-    finally:
-        await conn.close()
 
     # Save current params
     await page.client_storage.set_async(f"hb.{params.user_id}.params", params.to_query_string())
@@ -3,17 +3,15 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING
 
-import asyncpg
 import flet as ft
 import genshin
 
-from hoyo_buddy.config import CONFIG
 from hoyo_buddy.constants import GPY_GAME_TO_HB_GAME
 from hoyo_buddy.enums import Platform
 from hoyo_buddy.l10n import LocaleStr, translator
 from hoyo_buddy.utils import get_discord_protocol_url, get_discord_url
 
-from ..utils import clear_storage, show_error_banner
+from ..utils import clear_storage, get_pool, show_error_banner
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -156,8 +154,8 @@ class SubmitButton(ft.FilledButton):
             else genshin.Region.OVERSEAS
         )
 
-        conn = await asyncpg.connect(CONFIG.db_url)
-        try:
+        pool = await get_pool()
+        async with pool.acquire() as conn:
             await conn.execute(
                 'INSERT INTO "user" (id, temp_data) VALUES ($1, $2) ON CONFLICT (id) DO NOTHING',
                 user_id,
@@ -202,8 +200,6 @@ class SubmitButton(ft.FilledButton):
                 await conn.execute(
                     'UPDATE "hoyoaccount" SET current = true WHERE id = $1', account_id
                 )
-        finally:
-            await conn.close()
 
         clear_storage(
             page,
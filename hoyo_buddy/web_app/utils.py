@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from typing import TYPE_CHECKING, Any
 
 import ambr
 import asyncpg
+import cachetools
 import flet as ft
 import orjson
 from cryptography.fernet import Fernet
@@ -17,11 +19,18 @@ from hoyo_buddy.hoyo.clients.ambr import AmbrAPIClient
 from ..l10n import LocaleStr, translator
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Awaitable, Callable, Sequence
 
     from hoyo_buddy.db.models import GachaHistory
     from hoyo_buddy.enums import Locale
 
+FETCH_CACHE_TTL = 3600  # seconds
+_fetch_cache: cachetools.TTLCache[str, Any] = cachetools.TTLCache(maxsize=64, ttl=FETCH_CACHE_TTL)
+_fetch_locks: dict[str, asyncio.Lock] = {}
+
+CLIENT_STORAGE_WRITE_DELAY = 0.5  # seconds
+_pending_writes: dict[tuple[str, str], tuple[asyncio.TimerHandle, Any]] = {}
+
 
 class LoadingSnackBar(ft.SnackBar):
     def __init__(self, *, message: str | None = None, locale: Locale | None = None) -> None:
@@ -93,13 +102,18 @@ def show_error_banner(page: ft.Page, *, message: str, url: str | None = None) ->
     page.open(ErrorBanner(message, url=url))
 
 
+@functools.cache
+def _get_fernet() -> Fernet:
+    return Fernet(CONFIG.fernet_key)
+
+
 def decrypt_string(encrypted: str) -> str:
-    key = Fernet(CONFIG.fernet_key)
+    key = _get_fernet()
     return key.decrypt(encrypted.encode()).decode()
 
 
 def encrypt_string(string: str) -> str:
-    key = Fernet(CONFIG.fernet_key)
+    key = _get_fernet()
     return key.encrypt(string.encode()).decode()
 
 
@@ -119,60 +133,164 @@ def clear_storage(
         asyncio.create_task(page.client_storage.remove_async(f"hb.{user_id}.device_fp"))
 
 
-async def fetch_json_file(filename: str) -> Any:
-    conn = await asyncpg.connect(CONFIG.db_url)
-    try:
+class _PoolHolder:
+    """Holds the web app's lazily created connection pool."""
+
+    pool: asyncpg.Pool | None = None
+    lock = asyncio.Lock()
+
+
+async def get_pool() -> asyncpg.Pool:
+    """Get the web app's shared connection pool, creating it on first use."""
+    if _PoolHolder.pool is None:
+        async with _PoolHolder.lock:
+            if _PoolHolder.pool is None:
+                _PoolHolder.pool = await asyncpg.create_pool(CONFIG.db_url, min_size=1, max_size=10)
+    return _PoolHolder.pool
+
+
+async def close_pool() -> None:
+    """Close the web app's shared connection pool if it was created."""
+    pool = _PoolHolder.pool
+    _PoolHolder.pool = None
+    if pool is not None:
+        await pool.close()
+
+
+async def _fetch_json_file_from_db(filename: str) -> Any:
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        # Pooled connections keep asyncpg's prepared statement cache between calls
         json_string = await conn.fetchval('SELECT data FROM "jsonfile" WHERE name = $1', filename)
-        return orjson.loads(json_string)
-    finally:
-        await conn.close()
+    return orjson.loads(json_string)
+
+
+async def _cached_fetch(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the result of fetch(), cached in memory for FETCH_CACHE_TTL seconds.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    data = _fetch_cache.get(key)
+    if data is not None:
+        return data
+
+    lock = _fetch_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another task may have fetched the data while we were waiting for the lock
+        data = _fetch_cache.get(key)
+        if data is not None:
+            return data
+
+        data = await fetch()
+        _fetch_cache[key] = data
+        return data
+
+
+async def fetch_json_file(filename: str) -> Any:
+    """Fetch a JSON file from the database, cached in memory for FETCH_CACHE_TTL seconds.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    return await _cached_fetch(
+        f"jsonfile:{filename}", functools.partial(_fetch_json_file_from_db, filename)
+    )
+
+
+async def _fetch_ambr_item_names_from_api(locale: Locale) -> dict[str, str]:
+    async with AmbrAPIClient(locale) as client:
+        item_names = await client.fetch_item_id_to_name_map()
+    return {str(k): v for k, v in item_names.items()}
+
+
+async def fetch_ambr_item_names(locale: Locale) -> dict[str, str]:
+    """Fetch Genshin item ID to name map, cached in memory for FETCH_CACHE_TTL seconds.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    return await _cached_fetch(
+        f"ambr_item_names:{locale}", functools.partial(_fetch_ambr_item_names_from_api, locale)
+    )
+
+
+def _flush_client_storage_write(page: ft.Page, key: str) -> None:
+    pending = _pending_writes.pop((page.session_id, key), None)
+    if pending is not None:
+        asyncio.create_task(page.client_storage.set_async(key, pending[1]))
+
+
+def set_client_storage_debounced(page: ft.Page, key: str, value: Any) -> None:
+    """Write a value to the client storage after CLIENT_STORAGE_WRITE_DELAY seconds.
+
+    Writes to the same key within the delay are coalesced, only the latest value is written.
+    """
+    pending_key = (page.session_id, key)
+    pending = _pending_writes.get(pending_key)
+    if pending is not None:
+        pending[0].cancel()
+
+    handle = asyncio.get_running_loop().call_later(
+        CLIENT_STORAGE_WRITE_DELAY, _flush_client_storage_write, page, key
+    )
+    _pending_writes[pending_key] = (handle, value)
+
+
+async def get_client_storage(page: ft.Page, key: str) -> Any:
+    """Get a value from the client storage, including writes that haven't been flushed yet."""
+    pending = _pending_writes.get((page.session_id, key))
+    if pending is not None:
+        return pending[1]
+    return await page.client_storage.get_async(key)
 
 
 async def get_gacha_names(
     page: ft.Page, *, gachas: Sequence[GachaHistory], locale: Locale, game: Game
 ) -> dict[int, str]:
-    cached_gacha_names: dict[str, str] = (
-        await page.client_storage.get_async(f"hb.{locale}.{game.name}.gacha_names") or {}
-    )
+    storage_key = f"hb.{locale}.{game.name}.gacha_names"
+    cached_gacha_names: dict[str, str] = await get_client_storage(page, storage_key) or {}
 
     result: dict[int, str] = {}
     item_ids = list({g.item_id for g in gachas})
     non_cached_item_ids: list[int] = []
 
     for item_id in item_ids:
-        if str(item_id) in cached_gacha_names:
-            result[item_id] = cached_gacha_names[str(item_id)]
+        cached_name = cached_gacha_names.get(str(item_id))
+        if cached_name is not None:
+            result[item_id] = cached_name
         else:
             non_cached_item_ids.append(item_id)
 
-    if non_cached_item_ids:
-        # Update the cache with the new item names
-        if game is Game.ZZZ:
-            map_: dict[str, str] = await fetch_json_file(
-                f"zzz_item_names_{locale_to_zenless_data_lang(locale)}.json"
-            )
-            item_names = {int(k): v for k, v in map_.items()}
-        elif game is Game.STARRAIL:
-            map_: dict[str, str] = await fetch_json_file(
-                f"hsr_item_names_{locale_to_starrail_data_lang(locale)}.json"
-            )
-            item_names = {int(k): v for k, v in map_.items()}
-        elif game is Game.GENSHIN:
-            async with AmbrAPIClient(locale) as client:
-                item_names = await client.fetch_item_id_to_name_map()
-        else:
-            msg = f"Unsupported game: {game} for fetching gacha names"
-            raise ValueError(msg)
-
-        for item_id in non_cached_item_ids:
-            result[item_id] = item_names.get(item_id, "???")
+    if not non_cached_item_ids:
+        return result
 
-        cached_gacha_names.update({str(k): v for k, v in item_names.items()})
-        asyncio.create_task(
-            page.client_storage.set_async(
-                f"hb.{locale}.{game.name}.gacha_names", cached_gacha_names
-            )
+    # Update the cache with the new item names
+    item_names: dict[str, str]
+    if game is Game.ZZZ:
+        item_names = await fetch_json_file(
+            f"zzz_item_names_{locale_to_zenless_data_lang(locale)}.json"
+        )
+    elif game is Game.STARRAIL:
+        item_names = await fetch_json_file(
+            f"hsr_item_names_{locale_to_starrail_data_lang(locale)}.json"
         )
+    elif game is Game.GENSHIN:
+        item_names = await fetch_ambr_item_names(locale)
+    else:
+        msg = f"Unsupported game: {game} for fetching gacha names"
+        raise ValueError(msg)
+
+    # Only store the names that were missing, not the whole item map
+    cache_updated = False
+    for item_id in non_cached_item_ids:
+        str_item_id = str(item_id)
+        name = item_names.get(str_item_id)
+        if name is None:
+            result[item_id] = "???"
+        else:
+            result[item_id] = cached_gacha_names[str_item_id] = name
+            cache_updated = True
+
+    if cache_updated:
+        set_client_storage_debounced(page, storage_key, cached_gacha_names)
 
     return result
 
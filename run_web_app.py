@@ -8,6 +8,7 @@ from hoyo_buddy.config import CONFIG
 from hoyo_buddy.l10n import translator
 from hoyo_buddy.utils import entry_point
 from hoyo_buddy.web_app.app import ClientStorage, WebApp
+from hoyo_buddy.web_app.utils import close_pool
 
 
 async def web_app_entry(page: ft.Page) -> None:
@@ -16,17 +17,24 @@ async def web_app_entry(page: ft.Page) -> None:
     await app.initialize()
 
 
+async def main(port: int) -> None:
+    await translator.load()
+    try:
+        await ft.app_async(
+            web_app_entry,
+            port=port,
+            view=None,
+            assets_dir="hoyo_buddy/web_app/assets",
+            use_color_emoji=True,
+        )
+    finally:
+        await close_pool()
+
+
 if __name__ == "__main__":
     if CONFIG.web_app_port is None:
         msg = "Web app port is not configured in the settings."
         raise RuntimeError(msg)
 
     entry_point("logs/web_app.log")
-    asyncio.run(translator.load())
-    ft.app(
-        web_app_entry,
-        port=CONFIG.web_app_port,
-        view=None,
-        assets_dir="hoyo_buddy/web_app/assets",
-        use_color_emoji=True,
-    )
+    asyncio.run(main(CONFIG.web_app_port))